@@ -1,27 +1,60 @@
 import dash
 import dash_bootstrap_components as dbc
-from dash import dcc, html
+from dash import dcc, html, Patch
 from dash.dependencies import Input, Output, State, ALL
+import functools
 import pandas as pd
+import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
 import json
+import orjson
 from plotly.colors import sample_colorscale
+from shapely.geometry import shape, mapping
 import re  # For natural sorting
 
+# Compiled once at import; extract_number runs for every district name when
+# sorting and labelling, so the pattern should not be recompiled per call
+number_pattern = re.compile(r'\d+')
+
 # Helper function for natural sorting
 def extract_number(district_name):
     """
     Extracts the numerical part from a district name.
     Example: "Kreis 10" -> 10
     """
-    match = re.search(r'\d+', district_name)
+    match = number_pattern.search(district_name)
     return int(match.group()) if match else float('inf')  # Push non-matching to end
 
-# Load the data
-csv_data = pd.read_csv('1_Zurich_Einbrueche_2009-2023.csv') 
-population_data = pd.read_csv('Bevölkerungsanzahl.csv')
-with open('stzh.adm_stadtkreise_a.json') as f:
-    zurich_geojson = json.load(f)
+# Load the data with the multithreaded Arrow CSV reader, projecting only
+# the columns the dashboard uses and fixing the count dtypes at read time
+csv_data = pd.read_csv(
+    '1_Zurich_Einbrueche_2009-2023.csv',
+    engine='pyarrow',
+    usecols=['Stadtkreis_Name', 'Ausgangsjahr', 'Straftaten_total'],
+    dtype={'Straftaten_total': 'int32'}
+)
+population_data = pd.read_csv(
+    'Bevölkerungsanzahl.csv',
+    engine='pyarrow',
+    usecols=['KreisLang', 'Jahr', 'AnzBestWir'],
+    dtype={'AnzBestWir': 'int32'}
+)
+# orjson parses the geometry-heavy geojson several times faster than the
+# stdlib json module
+with open('stzh.adm_stadtkreise_a.json', 'rb') as f:
+    zurich_geojson = orjson.loads(f.read())
+
+# Slim the geojson down before it gets attached to the map figure: the
+# choropleth only matches on properties.bezeichnung, and the full-precision
+# polygon outlines are far finer than the map ever shows. Dropping the
+# unused properties and simplifying the outlines (Douglas-Peucker, ~10 m
+# tolerance) shrinks the payload shipped to the browser severalfold.
+for feature in zurich_geojson['features']:
+    feature['properties'] = {'bezeichnung': feature['properties']['bezeichnung']}
+    feature['geometry'] = mapping(
+        shape(feature['geometry']).simplify(0.0001, preserve_topology=True)
+    )
 
 # Ensure column names are consistent
 population_data.rename(columns={'Jahr': 'Year'}, inplace=True)
@@ -31,13 +64,19 @@ csv_data.rename(columns={'Ausgangsjahr': 'Year'}, inplace=True)
 population_data['Year'] = population_data['Year'].astype(int)
 csv_data['Year'] = csv_data['Year'].astype(int)
 
-# Merge burglary data with population data on district and year
+# Pre-sort both sides by their merge keys so the join works on ordered keys
+csv_data = csv_data.sort_values(['Stadtkreis_Name', 'Year'])
+population_data = population_data.sort_values(['KreisLang', 'Year'])
+
+# Merge burglary data with population data on district and year; the
+# population table has one row per (district, year), which validate asserts
 merged_data = pd.merge(
     csv_data,
     population_data[['KreisLang', 'Year', 'AnzBestWir']],
     left_on=['Stadtkreis_Name', 'Year'],
     right_on=['KreisLang', 'Year'],
-    how='left'
+    how='left',
+    validate='many_to_one'
 )
 
 # Handle missing population data
@@ -46,6 +85,16 @@ merged_data = merged_data.dropna(subset=['AnzBestWir'])
 # Calculate normalized burglary rate (e.g., per 1000 inhabitants)
 merged_data['Burglary_rate_per_1000'] = (merged_data['Straftaten_total'] / merged_data["AnzBestWir"]) * 1000
 
+# Downcast to the smallest dtypes that hold the data: the defaults (int64 /
+# float64 / object) are oversized for 15 years of per-district counts and
+# roughly quadruple the memory the frame needs
+merged_data = merged_data.astype({
+    'Year': 'int16',
+    'Straftaten_total': 'int32',
+    'AnzBestWir': 'int32',
+    'Burglary_rate_per_1000': 'float32'
+})
+
 # Calculate total burglaries across all years (2009-2023)
 total_burglaries_all_years = merged_data['Straftaten_total'].sum()
 total_burglary_rate_all_years = merged_data['Burglary_rate_per_1000'].sum()
@@ -53,6 +102,236 @@ total_burglary_rate_all_years = merged_data['Burglary_rate_per_1000'].sum()
 # Get sorted list of unique districts
 districts_sorted = sorted(merged_data['Stadtkreis_Name'].unique(), key=extract_number)
 
+# Extract each district's number once; the layout and the district sort in
+# the dashboard callback reuse this instead of re-running the regex
+district_numbers = {district: extract_number(district) for district in districts_sorted}
+
+# Row index of each district in the precomputed arrays, matching the
+# categorical codes below; selection lookups become O(1) instead of a
+# linear scan of districts_sorted per selected district
+district_index = {district: i for i, district in enumerate(districts_sorted)}
+
+# District names as an ordered Categorical: groupbys then run on the small
+# integer codes instead of hashing strings, and the fixed category order
+# matches districts_sorted
+merged_data['Stadtkreis_Name'] = pd.Categorical(
+    merged_data['Stadtkreis_Name'], categories=districts_sorted, ordered=True
+)
+merged_data['KreisLang'] = pd.Categorical(
+    merged_data['KreisLang'], categories=districts_sorted, ordered=True
+)
+
+# Precompute per-(district, year) aggregates once at import time.
+# The merged data has exactly one row per (district, year) pair, so the
+# groupby just fixes the ordering; the result is pivoted into two dense
+# NumPy arrays indexed as [district_idx, year_idx]. Callbacks then only
+# slice these small arrays instead of filtering the DataFrame each time.
+years_sorted = sorted(merged_data['Year'].unique())
+year_min = years_sorted[0]
+
+agg_by_dk = merged_data.groupby(['Stadtkreis_Name', 'Year'], sort=False)[
+    ['Straftaten_total', 'Burglary_rate_per_1000']
+].sum()
+totals_by_dk = (
+    agg_by_dk['Straftaten_total']
+    .unstack('Year')
+    .reindex(index=districts_sorted, columns=years_sorted)
+    .to_numpy()
+)
+rates_by_dk = (
+    agg_by_dk['Burglary_rate_per_1000']
+    .unstack('Year')
+    .reindex(index=districts_sorted, columns=years_sorted)
+    .to_numpy()
+)
+
+# City-wide totals per year plus the constant percentage factor: with no
+# district filter the totals card reduces to a sum over a contiguous slice
+# of this vector and a single multiply
+yearly_totals = totals_by_dk.sum(axis=0)
+percentage_factor = 100.0 / total_burglaries_all_years
+
+# Cached reduction over the precomputed arrays. The raw data never changes
+# at runtime, so repeated slider/metric/district interactions with the same
+# state become O(1) dict lookups instead of redoing the NumPy reductions.
+# Clear the cache (`_compute.cache_clear()`) if the data is ever reloaded.
+@functools.lru_cache(maxsize=256)
+def _compute(year_lo, year_hi, districts_key):
+    # districts_key is a sorted tuple of district names (empty = all districts)
+    if districts_key:
+        district_idx = [district_index[d] for d in districts_key]
+        district_names = list(districts_key)
+    else:
+        district_idx = list(range(len(districts_sorted)))
+        district_names = districts_sorted
+
+    totals_window = totals_by_dk[district_idx, year_lo:year_hi + 1]
+    rates_window = rates_by_dk[district_idx, year_lo:year_hi + 1]
+
+    # Totals card values (city-wide selections use the per-year vector)
+    if districts_key:
+        total_burglaries = totals_window.sum()
+    else:
+        total_burglaries = yearly_totals[year_lo:year_hi + 1].sum()
+    percentage_of_total_burglaries = total_burglaries * percentage_factor
+
+    # Safest / most dangerous district for both metrics (the cache key is
+    # metric-independent, so both are computed up front). argmin/argmax on
+    # the raw arrays avoids building an intermediate Series just to get a
+    # labelled extreme back out. The per-district sums are reduced once and
+    # reused for the means, so each window is swept a single time.
+    n_years = totals_window.shape[1]
+    total_sums = totals_window.sum(axis=1)
+    total_means = total_sums / n_years
+    rate_means = rates_window.mean(axis=1)
+    if district_names:
+        extremes = {
+            'Straftaten_total': (district_names[total_means.argmin()],
+                                 district_names[total_means.argmax()]),
+            'Burglary_rate_per_1000': (district_names[rate_means.argmin()],
+                                       district_names[rate_means.argmax()])
+        }
+    else:
+        extremes = {
+            'Straftaten_total': ("N/A", "N/A"),
+            'Burglary_rate_per_1000': ("N/A", "N/A")
+        }
+
+    # Aggregated chart values (sum the totals, average the rates)
+    return (
+        total_burglaries,
+        percentage_of_total_burglaries,
+        extremes,
+        tuple(district_names),
+        tuple(total_sums),
+        tuple(rate_means)
+    )
+
+# Define the continuous color scale (Blues)
+color_scale = px.colors.sequential.Blues
+
+# Build the two figures once at startup in the default state (all years,
+# all districts, burglary rate). Callbacks only patch the data arrays
+# afterwards, so the expensive figure construction runs once and the large
+# geojson payload is serialized to the client exactly once.
+(default_total, default_pct, default_extremes, default_names,
+ default_totals, default_rates) = _compute(0, len(years_sorted) - 1, ())
+default_agg = pd.DataFrame({
+    'Stadtkreis_Name': list(default_names),
+    'Straftaten_total': default_totals,
+    'Burglary_rate_per_1000': default_rates
+})
+
+# Static layouts, defined once: nothing in here ever changes at runtime
+# (the callbacks only patch trace data and the average line)
+map_layout = go.Layout(
+    height=325,
+    width=440,
+    margin={"r": 0, "t": 0, "l": 0, "b": 0},
+    coloraxis_showscale=True,
+    coloraxis_colorbar=dict(
+        title='Burglaries',
+        ticks="outside",
+    ),
+    font=dict(family="Times New Roman", size=12, color="black", style="italic")
+)
+bar_layout = go.Layout(
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    yaxis=dict(
+        showgrid=True,
+        gridcolor='#F0F0F0',
+        gridwidth=1,
+        title=None,
+        showticklabels=False
+    ),
+    xaxis=dict(
+        showgrid=True,
+        gridcolor='#F0F0F0',
+        gridwidth=1,
+        title=None
+    ),
+    height=325,
+    width=450,
+    margin={"r": 0, "t": 0, "l": 0, "b": 0},
+    font=dict(family="Times New Roman", size=12, color="black", style="italic")
+)
+
+# Choropleth Map
+fig_map_base = px.choropleth_mapbox(
+    default_agg,
+    geojson=zurich_geojson,
+    locations='Stadtkreis_Name',
+    featureidkey="properties.bezeichnung",
+    color='Burglary_rate_per_1000',
+    custom_data=['Straftaten_total', 'Burglary_rate_per_1000'],
+    labels={
+        'Burglary_rate_per_1000': 'Burglary Rate per 1000',
+        'Straftaten_total': 'Total Burglaries',
+        'Stadtkreis_Name': 'District'
+    },
+    mapbox_style="carto-positron",
+    zoom=10.3,
+    center={"lat": 47.3769, "lon": 8.5417},
+    color_continuous_scale=color_scale,
+)
+
+# Update hovertemplate
+fig_map_base.update_traces(
+    hovertemplate="<b>District:</b> %{location}<br>" +
+                  '<b>Burglary Rate per 1000:</b> %{customdata[1]:.0f}<br>' +
+                  '<b>Total Burglaries:</b> %{customdata[0]:.0f}<br>' +
+                  "<extra></extra>"
+)
+
+fig_map_base.update_layout(map_layout)
+
+# Bar chart in the same default state
+default_top12 = default_agg.sort_values(
+    by='Burglary_rate_per_1000', ascending=False
+).head(12).reset_index(drop=True)
+default_top12['color'] = default_top12['Burglary_rate_per_1000'] / default_top12['Burglary_rate_per_1000'].max()
+default_top12['display_value'] = default_top12['Burglary_rate_per_1000'].round(0)
+
+# Built with go.Bar directly: the trace carries exactly the arrays the
+# callback patches, without the px DataFrame-to-trace conversion
+fig_bar_base = go.Figure(
+    go.Bar(
+        x=default_top12['Stadtkreis_Name'].tolist(),
+        y=default_top12['display_value'].tolist(),
+        customdata=default_top12[['Straftaten_total', 'Burglary_rate_per_1000']].to_numpy().tolist(),
+        marker_color=sample_colorscale(color_scale, default_top12['color'].to_numpy()),
+        texttemplate='%{y}',
+        textposition='outside',
+        hovertemplate='<b>District:</b> %{x}<br>' +
+                      '<b>Burglary Rate per 1000:</b> %{customdata[1]:.0f}<br>' +
+                      '<b>Total Burglaries:</b> %{customdata[0]:.0f}<br>' +
+                      '<extra></extra>'
+    ),
+    layout=bar_layout
+)
+
+# Average line in the default state; callbacks move it (or hide it) by
+# patching shapes[0] / annotations[0] rather than re-adding it
+default_avg = default_agg['Burglary_rate_per_1000'].mean()
+fig_bar_base.add_hline(
+    y=default_avg,
+    line_dash="longdash",
+    annotation_text=f"Average {years_sorted[0]} - {years_sorted[-1]}: {default_avg:.0f}",
+    annotation_font_color="red",
+    annotation_position="top right",
+    line_color="red",
+    opacity=0.5
+)
+
+# Default card texts for the initial page load: with these baked into the
+# layout (and prevent_initial_call on the callbacks below) the first paint
+# happens without a single callback round-trip
+default_total_text = f"{int(default_total):,} burglaries"
+default_percentage_text = f"{default_pct:.2f}% of total burglaries"
+default_safest, default_dangerous = default_extremes['Burglary_rate_per_1000']
+default_title = f"⛓️ Burglaries between {years_sorted[0]} - {years_sorted[-1]}"
+
 # Initialize the app with a light Bootstrap theme
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.FLATLY])
 
@@ -118,9 +397,9 @@ app.layout = dbc.Container([
     dbc.Row([
         dbc.Col([
             dbc.Button(
-                "Normalized Burglary Rate", 
+                "Normalized Burglary Rate",
                 id="button-burglary-rate",
-                className="metric-button",  # Assign class for easier CSS targeting
+                className="metric-button active",  # Default metric, pre-selected on load
                 n_clicks=0,
                 style={
                     "margin-right": "10px",  # Adds space to the right of this button
@@ -169,16 +448,16 @@ app.layout = dbc.Container([
                 html.Div([
                     # Card content
                     html.Div([
-                        html.H4(id='dynamic-title', className="card-title text-center", style={
+                        html.H4(default_title, id='dynamic-title', className="card-title text-center", style={
                             "font-family": "Helvetica", "font-weight": "bold", "font-size": "18px"
                         }),
                         html.Div([
-                            html.H5(id="total-burglaries", className="card-text text-center", style={
+                            html.H5(default_total_text, id="total-burglaries", className="card-text text-center", style={
                                 "font-family": "Times New Roman", "font-style": "italic", "font-size": "16px",
                                 "display": "inline-block"
                             }),
                             html.Span("|", style={"margin": "0 10px"}),                
-                            html.H6(id="total-burglaries-percentage", className="text-success text-center", style={
+                            html.H6(default_percentage_text, id="total-burglaries-percentage", className="text-success text-center", style={
                                 "font-family": "Times New Roman", "font-style": "italic", "font-size": "16px",
                                 "display": "inline-block"
                             }),
@@ -217,7 +496,7 @@ app.layout = dbc.Container([
                         html.H4("🔒 Safest District", className="card-title text-center", style={
                             "font-family": "Helvetica", "font-weight": "bold", "font-size": "18px"
                         }),
-                        html.H5(id="safest-stadtkreis", className="card-text text-center", style={
+                        html.H5(default_safest, id="safest-stadtkreis", className="card-text text-center", style={
                             "font-family": "Times New Roman", "font-style": "italic", "font-size": "16px"
                         })
                     ], className="d-flex flex-column align-items-center justify-content-center", style={"height": "100%"}), # Added flex styling here
@@ -248,7 +527,7 @@ app.layout = dbc.Container([
                         html.H4("🔓 Vulnerable District", className="card-title text-center", style={
                             "font-family": "Helvetica", "font-weight": "bold", "font-size": "18px"
                         }),
-                        html.H5(id="dangerous-stadtkreis", className="card-text text-center", style={
+                        html.H5(default_dangerous, id="dangerous-stadtkreis", className="card-text text-center", style={
                             "font-family": "Times New Roman", "font-style": "italic", "font-size": "16px"
                         })
                     ], className="d-flex flex-column align-items-center justify-content-center", style={"height": "100%"}), # Added flex styling here
@@ -317,7 +596,7 @@ app.layout = dbc.Container([
                     html.Div(
                         [
                             dbc.Button(
-                                f"{extract_number(district)}",
+                                f"{district_numbers[district]}",
                                 id={'type': 'district-button', 'index': district},
                                 className='metric-button district-circle',  # Combined classes
                                 n_clicks=0
@@ -372,7 +651,7 @@ app.layout = dbc.Container([
     dbc.Row([
         dbc.Col([
             html.Div(
-                dcc.Graph(id='choropleth-map', style={
+                dcc.Graph(id='choropleth-map', figure=fig_map_base, style={
                     "padding": "10px", "margin": "0", "height": "400px", "width": "100%"
                 }),
                 style={
@@ -388,7 +667,7 @@ app.layout = dbc.Container([
         ], width=4, style={"padding": "0", "margin-left": "35px"}),
         dbc.Col([
             html.Div(
-                dcc.Graph(id='bar-chart', style={
+                dcc.Graph(id='bar-chart', figure=fig_bar_base, style={
                     "padding": "10px", "margin": "0", "width": "100%"
                 }),
                 style={
@@ -405,44 +684,52 @@ app.layout = dbc.Container([
     ], justify="center", style={"width": "100%"})
 ], fluid=True)
 
-# Callback to update metric button classes and selected metric
-@app.callback(
+# Clientside callback to update metric button classes and selected metric.
+# Pure UI state: running it in the browser avoids a server round-trip on
+# every metric click (only update_dashboard still needs the server).
+app.clientside_callback(
+    """
+    function(rate_clicks, total_clicks, selected_metric) {
+        var rate_class = "metric-button";
+        var total_class = "metric-button";
+
+        var triggered = dash_clientside.callback_context.triggered;
+        if (!triggered.length) {
+            // App initialization (default state)
+            rate_class += " active";
+            selected_metric = "Burglary_rate_per_1000";
+        } else {
+            var triggered_id = triggered[0].prop_id.split(".")[0];
+            if (triggered_id === "button-burglary-rate") {
+                rate_class += " active";
+                selected_metric = "Burglary_rate_per_1000";
+            } else if (triggered_id === "button-total-burglaries") {
+                total_class += " active";
+                selected_metric = "Straftaten_total";
+            }
+        }
+
+        return [rate_class, total_class, selected_metric];
+    }
+    """,
     [Output("button-burglary-rate", "className"),
      Output("button-total-burglaries", "className"),
      Output("selected-metric", "data")],
     [Input("button-burglary-rate", "n_clicks"),
      Input("button-total-burglaries", "n_clicks")],
-    [State("selected-metric", "data")]
+    [State("selected-metric", "data")],
+    prevent_initial_call=True
 )
-def update_button_states(rate_clicks, total_clicks, selected_metric):
-    # Set default class names
-    rate_class = "metric-button"
-    total_class = "metric-button"
 
-    # Handle None values for n_clicks (initial state)
-    rate_clicks = rate_clicks or 0
-    total_clicks = total_clicks or 0
-
-    # Determine which input triggered the callback
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        # App initialization (default state)
-        rate_class += " active"
-        selected_metric = "Burglary_rate_per_1000"
-    else:
-        triggered_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        if triggered_id == "button-burglary-rate":
-            rate_class += " active"
-            selected_metric = "Burglary_rate_per_1000"
-        elif triggered_id == "button-total-burglaries":
-            total_class += " active"
-            selected_metric = "Straftaten_total"
-
-    return rate_class, total_class, selected_metric
-
-# Callback to handle district selection via circles and reset filters
+# Callback to handle district selection via circles and reset filters.
+# The store update and the circle classNames come out of the same callback
+# so a click costs a single round-trip, and only the clicked circle's class
+# is re-sent (every other entry stays dash.no_update).
 @app.callback(
-    Output('selected-districts', 'data'),
+    [
+        Output('selected-districts', 'data'),
+        Output({'type': 'district-button', 'index': ALL}, 'className')
+    ],
     [
         Input({'type': 'district-button', 'index': ALL}, 'n_clicks'),
         Input('button-reset-filters', 'n_clicks')
@@ -450,46 +737,42 @@ def update_button_states(rate_clicks, total_clicks, selected_metric):
     [
         State({'type': 'district-button', 'index': ALL}, 'id'),
         State('selected-districts', 'data')
-    ]
+    ],
+    prevent_initial_call=True
 )
 def update_selected_districts(district_n_clicks, reset_n_clicks, ids, selected_districts):
     ctx = dash.callback_context
+    unchanged_classes = [dash.no_update] * len(ids)
 
     if not ctx.triggered:
-        return selected_districts
+        return selected_districts, unchanged_classes
     else:
         triggered = ctx.triggered[0]
         prop_id = triggered['prop_id'].split('.')[0]
 
         if prop_id == 'button-reset-filters':
             # Reset filters: deselect all districts
-            return []
+            return [], ['metric-button district-circle'] * len(ids)
         else:
             # It must be a district button
             try:
                 button_id = json.loads(prop_id)
                 district_name = button_id['index']
             except:
-                return selected_districts
+                return selected_districts, unchanged_classes
 
             if district_name in selected_districts:
                 selected_districts = [d for d in selected_districts if d != district_name]
+                toggled_class = 'metric-button district-circle'
             else:
                 selected_districts = selected_districts + [district_name]
+                toggled_class = 'metric-button district-circle active'
 
-            return selected_districts
-
-# Callback to update district button classes based on selection
-@app.callback(
-    Output({'type': 'district-button', 'index': ALL}, 'className'),
-    [Input('selected-districts', 'data')],
-    [State({'type': 'district-button', 'index': ALL}, 'id')]
-)
-def update_district_button_classes(selected_districts, button_ids):
-    return [
-        'metric-button district-circle active' if button_id['index'] in selected_districts else 'metric-button district-circle'
-        for button_id in button_ids
-    ]
+            classes = [
+                toggled_class if b['index'] == district_name else dash.no_update
+                for b in ids
+            ]
+            return selected_districts, classes
 
 
 def display_selected_districts(selected_districts):
@@ -516,171 +799,88 @@ def display_selected_districts(selected_districts):
         Input('year-slider', 'value'),
         Input('selected-metric', 'data'),
         Input('selected-districts', 'data')
-    ]
+    ],
+    prevent_initial_call=True
 )
 def update_dashboard(selected_years, selected_metric, selected_districts):
     # Map the selected_metric to a label
     metric_label = 'Burglaries' if selected_metric == 'Straftaten_total' else 'Burglaries'
 
-    # Filter data for the selected year range
-    filtered_data = merged_data[
-        (merged_data['Year'] >= selected_years[0]) &
-        (merged_data['Year'] <= selected_years[1])
-    ]
-    
-    # Handle district filter
-    if selected_districts and selected_districts != []:
-        filtered_data = filtered_data[filtered_data['Stadtkreis_Name'].isin(selected_districts)]
-    else:
-        # If no districts are selected, show all
-        filtered_data = merged_data[
-            (merged_data['Year'] >= selected_years[0]) &
-            (merged_data['Year'] <= selected_years[1])
-        ]
-
-    # Handle missing population data
-    filtered_data = filtered_data.dropna(subset=['AnzBestWir'])
-    
-    # Calculate total burglaries and percentage for the total burglaries card
-    total_burglaries = filtered_data['Straftaten_total'].sum()
-    percentage_of_total_burglaries = (total_burglaries / total_burglaries_all_years) * 100
-
-    # Find the safest and most dangerous districts based on the selected metric
-    if not filtered_data.empty:
-        safest_stadtkreis = filtered_data.groupby('Stadtkreis_Name')[selected_metric].mean().idxmin()
-        dangerous_stadtkreis = filtered_data.groupby('Stadtkreis_Name')[selected_metric].mean().idxmax()
-    else:
-        safest_stadtkreis = "N/A"
-        dangerous_stadtkreis = "N/A"
-    
-    # Aggregate data for charts
-    if selected_metric == 'Straftaten_total':
-        filtered_data_agg = filtered_data.groupby('Stadtkreis_Name').agg({
-            'Straftaten_total': 'sum',
-            'Burglary_rate_per_1000': 'mean'
-        }).reset_index()
-    else:
-        filtered_data_agg = filtered_data.groupby('Stadtkreis_Name').agg({
-            'Burglary_rate_per_1000': 'mean',
-            'Straftaten_total': 'sum'
-        }).reset_index()
-    
-    # Define the continuous color scale (Blues)
-    color_scale = px.colors.sequential.Blues
-    
-    # Choropleth Map
-    fig_map = px.choropleth_mapbox(
-        filtered_data_agg,
-        geojson=zurich_geojson,
-        locations='Stadtkreis_Name',
-        featureidkey="properties.bezeichnung",
-        color=selected_metric,
-        custom_data=['Straftaten_total', 'Burglary_rate_per_1000'],
-        labels={
-            'Burglary_rate_per_1000': 'Burglary Rate per 1000',
-            'Straftaten_total': 'Total Burglaries',
-            'Stadtkreis_Name': 'District'
-        },
-        mapbox_style="carto-positron",
-        zoom=10.3,
-        center={"lat": 47.3769, "lon": 8.5417},
-        color_continuous_scale=color_scale,
-    )
-    
-    # Update hovertemplate
-    fig_map.update_traces(
-        hovertemplate="<b>District:</b> %{location}<br>" +
-                      '<b>Burglary Rate per 1000:</b> %{customdata[1]:.0f}<br>' +
-                      '<b>Total Burglaries:</b> %{customdata[0]:.0f}<br>' +
-                      "<extra></extra>"
-    )
-    
-    fig_map.update_layout(
-        height=325,
-        width=440,
-        margin={"r": 0, "t": 0, "l": 0, "b": 0},
-        coloraxis_showscale=True,
-        coloraxis_colorbar=dict(
-            title=metric_label,
-            ticks="outside",
-        ),
-        font=dict(family="Times New Roman", size=12, color="black", style="italic")
+    # Handle district filter (sorted tuple so equivalent selections share a
+    # cache entry; empty tuple = all districts)
+    districts_key = tuple(sorted(selected_districts or (), key=district_numbers.get))
+
+    # All reductions are memoized on (year range, districts)
+    (total_burglaries, percentage_of_total_burglaries, extremes,
+     district_names, district_totals, district_rates) = _compute(
+        selected_years[0] - year_min,
+        selected_years[1] - year_min,
+        districts_key
     )
-    
-    # Prepare data for the bar chart
-    top12_data = filtered_data_agg.sort_values(by=selected_metric, ascending=False).head(12).reset_index(drop=True)
-    top12_data['color'] = top12_data[selected_metric] / top12_data[selected_metric].max()
-    
+    safest_stadtkreis, dangerous_stadtkreis = extremes[selected_metric]
+
+    # Aggregated chart data stays in plain NumPy end to end; the arrays go
+    # straight into the figure patches without a DataFrame in between
+    district_names = np.asarray(district_names)
+    district_totals = np.asarray(district_totals)
+    district_rates = np.asarray(district_rates)
+    metric_values = district_totals if selected_metric == 'Straftaten_total' else district_rates
+    customdata = np.column_stack((district_totals, district_rates))
+
+    # Patch the choropleth map in place: only the data arrays change, the
+    # geojson and layout already live in the client-side figure
+    fig_map = Patch()
+    fig_map['data'][0]['locations'] = district_names.tolist()
+    fig_map['data'][0]['z'] = metric_values.tolist()
+    fig_map['data'][0]['customdata'] = customdata.tolist()
+
+    # Prepare data for the bar chart (top 12 districts, descending).
+    # nlargest-style partial selection: only the top 12 are fully ordered,
+    # everything below the cut is never sorted.
+    if metric_values.size > 12:
+        top12_order = np.argpartition(metric_values, -12)[-12:]
+    else:
+        top12_order = np.arange(metric_values.size)
+    top12_order = top12_order[np.argsort(metric_values[top12_order])[::-1]]
+    top12_values = metric_values[top12_order]
+
     # Round values if necessary
     if selected_metric == 'Burglary_rate_per_1000':
-        top12_data['display_value'] = top12_data[selected_metric].round(0)
+        display_values = top12_values.round(0)
     else:
-        top12_data['display_value'] = top12_data[selected_metric]
-    
+        display_values = top12_values
+
     # Calculate the average value
-    if not filtered_data_agg.empty and len(filtered_data_agg) > 1:
-        avg_value = filtered_data_agg[selected_metric].mean()
+    if len(metric_values) > 1:
+        avg_value = metric_values.mean()
     else:
         avg_value = None  # No average line if only one district
-    
-    # Create the bar chart
-    fig_bar = px.bar(
-        top12_data,
-        x='Stadtkreis_Name',
-        y='display_value',
-        custom_data=['Straftaten_total', 'Burglary_rate_per_1000'],
-        labels={
-            'display_value': metric_label,
-            'Stadtkreis_Name': 'District'
-        }
-    )
-    
-    # Update the layout
-    fig_bar.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='#F0F0F0',
-            gridwidth=1,
-            title=None,
-            showticklabels=False
-        ),
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='#F0F0F0',
-            gridwidth=1,
-            title=None
-        ),
-        height=325,
-        width=450,
-        margin={"r": 0, "t": 0, "l": 0, "b": 0},
-        font=dict(family="Times New Roman", size=12, color="black", style="italic")
-    )
-    
-    # Update traces
-    fig_bar.update_traces(
-        marker_color=top12_data['color'].apply(lambda x: sample_colorscale(color_scale, x)[0]),
-        texttemplate='%{y}',
-        textposition='outside',
-        hovertemplate='<b>District:</b> %{x}<br>' +
-                      '<b>Burglary Rate per 1000:</b> %{customdata[1]:.0f}<br>' +
-                      '<b>Total Burglaries:</b> %{customdata[0]:.0f}<br>' +
-                      '<extra></extra>'
+
+    # Patch the bar chart in place
+    fig_bar = Patch()
+    fig_bar['data'][0]['x'] = district_names[top12_order].tolist()
+    fig_bar['data'][0]['y'] = display_values.tolist()
+    fig_bar['data'][0]['customdata'] = customdata[top12_order].tolist()
+    # One vectorized colorscale lookup for all bars instead of a per-row apply
+    fig_bar['data'][0]['marker']['color'] = sample_colorscale(
+        color_scale, top12_values / top12_values.max()
     )
-    
+
+    # Move (or hide) the average line added to the base figure
     if avg_value is not None:
-        fig_bar.add_hline(
-            y=avg_value,
-            line_dash="longdash",
-            annotation_text=f"Average {selected_years[0]} - {selected_years[1]}: {avg_value:.0f}",
-            annotation_font_color="red",
-            annotation_position="top right",
-            line_color="red",
-            opacity=0.5
+        fig_bar['layout']['shapes'][0]['y0'] = avg_value
+        fig_bar['layout']['shapes'][0]['y1'] = avg_value
+        fig_bar['layout']['shapes'][0]['visible'] = True
+        fig_bar['layout']['annotations'][0]['y'] = avg_value
+        fig_bar['layout']['annotations'][0]['text'] = (
+            f"Average {selected_years[0]} - {selected_years[1]}: {avg_value:.0f}"
         )
+        fig_bar['layout']['annotations'][0]['visible'] = True
+    else:
+        fig_bar['layout']['shapes'][0]['visible'] = False
+        fig_bar['layout']['annotations'][0]['visible'] = False
+
 
-    
     # Update total burglaries and percentage text
     total_burglaries_text = f"{int(total_burglaries):,} burglaries"
     percentage_text = f"{percentage_of_total_burglaries:.2f}% of total burglaries"